@@ -6,24 +6,28 @@ from typing import ClassVar, Self
 
 class Alias(str):
     LEN: ClassVar[int] = 2
+    ALPHABET: ClassVar[str] = string.ascii_uppercase
+    BASE: ClassVar[int] = len(ALPHABET)
+    LETTERS: ClassVar[bytes] = ALPHABET.encode('ascii')
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__qualname__} {super().__repr__()}>"
 
-    @staticmethod
-    def _gen_letter_(seed: int) -> str:
-        index = seed % len(string.ascii_uppercase)
-        return string.ascii_uppercase[index]
+    @classmethod
+    def _gen_letter_(cls, seed: int) -> str:
+        return cls.ALPHABET[seed % cls.BASE]
 
-    @staticmethod
-    def _partition_seed_(seed: int, size: int, base: int) -> list[int]:
-        return [(seed // base**x) % base for x in range(size)]
+    @classmethod
+    def capacity(cls) -> int:
+        return cls.BASE**cls.LEN
 
     @classmethod
     def gen(cls, seed: int) -> Self:
-        letters = cls._partition_seed_(seed, cls.LEN, len(string.ascii_uppercase))
-        alias = str().join(string.ascii_uppercase[num] for num in letters)
-        return cls(alias)
+        letters = bytearray(cls.LEN)
+        for index in range(cls.LEN):
+            seed, digit = divmod(seed, cls.BASE)
+            letters[index] = cls.LETTERS[digit]
+        return cls(letters.decode('ascii'))
 
     def __init__(self, alias: str) -> None:
         if len(alias) != self.LEN:
@@ -33,7 +37,7 @@ class Alias(str):
 class RandomAlias(Alias):
     @classmethod
     def gen(cls, seed: int) -> Self:
-        alias = str().join(random.choice(string.ascii_uppercase) for _ in range(cls.LEN))
+        alias = str().join(random.choices(cls.ALPHABET, k=cls.LEN))
         return cls(alias)
 
 
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from typing import Any, ClassVar, Mapping, NotRequired, Sequence, TypedDict
 
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config import trace
-from tools import AppError
+from tools import AppError, parse_json
 
 
 BackendData = Mapping[str, Any]
@@ -25,13 +28,19 @@ class Credentials(TypedDict):
 
 class Backend:
     API: ClassVar[str]
+    POOL_SIZE: ClassVar[int] = 16
+    RETRIES: ClassVar[Retry] = Retry(total=3, backoff_factor=0.3)
 
     @classmethod
-    def login(cls, credentials: Credentials):
+    def login(cls, credentials: Credentials) -> bool:
+        """Open API session, return False if it is already open"""
         if cls._session_ is not None:
             trace("Already logged in")
-            return
+            return False
         cls._session_ = Session()
+        adapter = HTTPAdapter(pool_maxsize=cls.POOL_SIZE, max_retries=cls.RETRIES)
+        cls._session_.mount('https://', adapter)
+        return True
 
     @classmethod
     def logout(cls):
@@ -47,6 +56,16 @@ class Backend:
     def get_entries(cls, start: date, end: date) -> Sequence[BackendData]:
         raise NotImplementedError
 
+    @classmethod
+    def get_data(
+        cls, start: date, end: date
+    ) -> tuple[Sequence[BackendData], Sequence[BackendData]]:
+        """Request tasks and entries concurrently, return them as (tasks, entries)"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            tasks = executor.submit(cls.get_tasks)
+            entries = executor.submit(cls.get_entries, start, end)
+            return tasks.result(), entries.result()
+
     _session_: ClassVar[Session | None] = None
 
     @classmethod
@@ -54,20 +73,20 @@ class Backend:
         if cls._session_ is None:
             raise AppError("Session is not open")
         response = cls._session_.get(f'{cls.API}/{path}', params=kwargs)
-        if not response:
+        if not response.ok:
             raise ApiError(f"GET /{path} - code {response.status_code} - {response.text}")
         trace(f"GET /{path} - OK {response.status_code}")
-        return response.json()
+        return parse_json(response.content)
 
     @classmethod
     def _post_(cls, path: str, request: Json | None = None) -> Json:
         if cls._session_ is None:
             raise AppError("Session is not open")
         response = cls._session_.post(f'{cls.API}/{path}', json=request)
-        if not response:
+        if not response.ok:
             raise ApiError(f"POST /{path} - code {response.status_code} - {response.text}")
         trace(f"POST /{path} - OK {response.status_code}")
-        return response.json() if request else {}
+        return parse_json(response.content) if request else {}
 
 
 if __name__ == '__main__':
@@ -3,7 +3,7 @@ from __future__ import annotations
 import sys
 from traceback import print_exception
 
-from command import Command
+from command import Command, ParseMemo
 from config import CONFIG
 
 
@@ -16,11 +16,14 @@ class App:
 
     @classmethod
     def process(cls, command: str):
-        max_parsed = 0
+        # Commands skipped by dispatch fail right after leading whitespace
+        max_parsed = len(command) - len(command.lstrip())
 
-        for cmd in Command.all.values():
+        memo: ParseMemo = {}
+
+        for cmd in Command.candidates(command):
             try:
-                parsed = cmd.parse(command)
+                parsed = cmd.parse(command, memo)
             # pylint: disable=broad-except
             except Exception as error:
                 print_exception(error)
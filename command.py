@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 import sys
 from datetime import date, time, timedelta
 from enum import Enum
@@ -28,8 +29,12 @@ match CONFIG.backend:
 
 Handler = Callable[..., Any]
 Template = List[Type[Token] | str]
+ParseMemo = Dict[Tuple[Type[Token], int], Token | None]
+Component = Tuple[str, None] | Tuple[None, Type[Token]]
 LoadMethod = Literal['get', 'load', 'fetch']
 
+WHITESPACE_REGEX = re.compile(r'\s*')
+
 
 class Group(Enum):
     SHOW = 'show'
@@ -46,26 +51,50 @@ class Group(Enum):
 
 class Command:
     all: ClassVar[Dict[str, Command]] = {}
+    by_initial: ClassVar[Dict[str, List[Command]]] = {}
 
     group: Group
     pattern: Template
+    components: List[Component]
     handler: Handler
     description: str | None
+    signature: str
 
     def __init__(self, group: Group, tokens: Template):
         self.group = group
         self.pattern = tokens
+        # Sort out literals and tokens once, so that parsing needs no type checks
+        self.components = [(x, None) if isinstance(x, str) else (None, x) for x in tokens]
 
     def __call__(self, func: Handler) -> Handler:
         """Decorator descriptor"""
         self.handler = func
         self.description = func.__doc__
+        tokens = (x if isinstance(x, str) else f'[{x.__name__}]' for x in self.pattern)
+        self.signature = ' '.join(tokens)
         self.__class__.all[func.__name__] = self
+        self.__class__.by_initial.clear()
         return func
 
-    def parse(self, command: str) -> int | None:
+    @classmethod
+    def candidates(cls, command: str) -> List[Command]:
+        """Select commands that may match the input judging by its first character"""
+        initial = command.lstrip()[:1]
+        if initial not in cls.by_initial:
+            matching = [cmd for cmd in cls.all.values() if cmd._accepts_(initial)]
+            cls.by_initial[initial] = matching
+        return cls.by_initial[initial]
+
+    def _accepts_(self, initial: str) -> bool:
+        leading = self.pattern[0]
+        return not initial or not isinstance(leading, str) or leading.startswith(initial)
+
+    def parse(self, command: str, memo: ParseMemo | None = None) -> int | None:
+        # Tokens parsed at given positions are shared across commands via `memo`
         tokens: List[Token] = []
         marker: int = 0
+        if memo is None:
+            memo = {}
 
         # Enter means 'show' commands
         # TODO: change this to "last entered command" and remove Table.display_latest()
@@ -73,34 +102,45 @@ class Command:
             Table.display_latest()
             return None
 
-        for component in self.pattern:
+        for literal, token_type in self.components:
             # Skip whitespace
-            marker += len(command[marker:]) - len(command[marker:].lstrip())
+            whitespace = WHITESPACE_REGEX.match(command, marker)
+            assert whitespace is not None
+            marker = whitespace.end()
 
             # Match syntax literal
-            if isinstance(component, str):
-                if command.startswith(component, marker):
-                    marker += len(component)
+            if literal is not None:
+                if command.startswith(literal, marker):
+                    marker += len(literal)
                 else:
                     return marker
 
             # Match and parse Token
-            elif isinstance(component, type):
-                token = component()
-                token.parse(command, marker)
-                if token.match is not None:
-                    tokens.append(token)
-                    marker = token.match.end()
+            else:
+                assert token_type is not None
+                key = (token_type, marker)
+                if key in memo:
+                    parsed = memo[key]
+                else:
+                    token = token_type()
+                    parsed = memo[key] = token if token.parse(command, marker) else None
+                if parsed is not None:
+                    assert parsed.match is not None
+                    tokens.append(parsed)
+                    marker = parsed.match.end()
                 else:
                     return marker
 
         # Check for leftover symbols
-        if command[marker:].strip():
+        trailing = WHITESPACE_REGEX.match(command, marker)
+        assert trailing is not None
+        if trailing.end() != len(command):
             return marker
 
         # Execute handler
-        args = [token.evaluate() for token in tokens]
-        self.handler(*args)
+        # Tokens are evaluated only now: evaluation may fail (e.g. unknown alias),
+        # which must not happen for commands that do not match the input entirely
+        self.handler(*(token.evaluate() for token in tokens))
 
         return None
 
@@ -110,22 +150,17 @@ class Command:
         table: List[Tuple[str, str, str, str]] = []
         for func_name, cmd in cls.all.items():
             name = func_name.replace('_', ' ').capitalize()
-            tokens = (x if isinstance(x, str) else f'[{x.__name__}]' for x in cmd.pattern)
-            table.append((name, ' '.join(tokens), cmd.description or '', cmd.group.name))
+            table.append((name, cmd.signature, cmd.description or '', cmd.group.name))
         widths = tuple((max(len(row[n]) for row in table) for n in range(2)))
         for key, group in groupby(table, key=itemgetter(3)):
             print(f"\n{key}:")
             for name, signature, description, groupname in group:
                 print(f"  {name:{widths[0]}}  {signature:{widths[1]}}  {description}")
 
-    def signature(self):
-        tokens = (x if isinstance(x, str) else f'[{x.__name__}]' for x in self.pattern)
-        return ' '.join(tokens)
-
     @classmethod
     def show_help(cls):
-        for cmd in cls.all.values():
-            print(f"{cmd.signature()} - {cmd.description}")
+        lines = (f"{cmd.signature} - {cmd.description}" for cmd in cls.all.values())
+        print('\n'.join(lines))
 
 
 @Command(Group.SHOW, ['show'])
@@ -193,8 +228,7 @@ def load_data_for_day(method: LoadMethod, day: date):
             Entry.load(day, day)
         case 'fetch':
             Server.login(CONFIG.credentials[CONFIG.backend])
-            Task.fetch()
-            Entry.fetch(day, day)
+            Entry.fetch_all(day, day)
     action: str = method.capitalize() + 'ed'
     trace(f"{action} {len(Entry.all)} entries for {day:{Format.YMD}} day")
 
@@ -212,8 +246,7 @@ def load_data_for_week(method: LoadMethod, monday: date):
             Entry.load(monday, friday)
         case 'fetch':
             Server.login(CONFIG.credentials[CONFIG.backend])
-            Task.fetch()
-            Entry.fetch(monday, friday)
+            Entry.fetch_all(monday, friday)
     action: str = method.capitalize() + 'ed'
     trace(f"{action} {len(Entry.all)} entries for {monday:{Format.YMD}} week")
 
@@ -230,8 +263,7 @@ def load_data_for_period(method: LoadMethod, start: date, end: date):
             Entry.load(start, end)
         case 'fetch':
             Server.login(CONFIG.credentials[CONFIG.backend])
-            Task.fetch()
-            Entry.fetch(start, end)
+            Entry.fetch_all(start, end)
     action: str = method.capitalize() + 'ed'
     time_period: str = f"{start:{Format.YMD}} — {end:{Format.YMD}} period"
     trace(f"{action} {len(Entry.all)} entries for {time_period}")
@@ -247,46 +279,49 @@ def delete_entry(entry: Entry):
 @Command(Group.DELETE, ['del', Date])
 def delete_entries_for_day(day: date):
     """Delete all entries within the specified date"""
-    deleted = 0
-    for entry in list(Entry.all.values()):
-        if entry.start.date() == day:
-            entry.delete()
-            deleted += 1
-    trace(f"Removed {deleted} entries within {day:{Format.YMD}} day")
+    deleted = list(Entry.within(day, day))
+    for entry in deleted:
+        entry.delete()
+    trace(f"Removed {len(deleted)} entries within {day:{Format.YMD}} day")
 
 
 @Command(Group.DELETE, ['del', Date, '..', Date])
 def delete_entries_for_period(start: date, end: date):
     """Delete all entries for the specified time period"""
-    deleted = 0
-    for entry in list(Entry.all.values()):
-        if start <= entry.start.date() <= end:
-            entry.delete()
-            deleted += 1
+    deleted = list(Entry.within(start, end))
+    for entry in deleted:
+        entry.delete()
     time_period: str = f"{start:{Format.YMD}} — {end:{Format.YMD}} period"
-    trace(f"Removed {deleted} entries within {time_period}")
+    trace(f"Removed {len(deleted)} entries within {time_period}")
 
 
 @Command(Group.DELETE, ['del', 'personal'])
 def delete_personal_entries():
     """Delete all entries with activities that does not have associated Jira ID"""
-    deleted = 0
-    for entry in list(Entry.all.values()):
-        if entry.task.type is TaskType.PERSONAL:
-            entry.delete()
-            deleted += 1
-    trace(f"Removed {deleted} personal entries")
+    deleted = [
+        entry
+        for task, entries in Entry.by_task.items()
+        if task.type is TaskType.PERSONAL
+        for entry in entries.values()
+    ]
+    for entry in deleted:
+        entry.delete()
+    trace(f"Removed {len(deleted)} personal entries")
 
 
 @Command(Group.DELETE, ['del', JiraID])
-def delete_entries_by_task_name(target_task: str):
+def delete_entries_by_task_name(target_task: Task):
     """Delete all entries with the specified task name"""
-    deleted = 0
-    for entry in list(Entry.all.values()):
-        if entry.task.name == target_task:
-            entry.delete()
-            deleted += 1
-    trace(f"Removed {deleted} entries with task name '{target_task}'")
+    # Several tasks may share the same Jira ticket, e.g. with different specs
+    deleted = [
+        entry
+        for task, entries in Entry.by_task.items()
+        if task.jira == target_task.jira
+        for entry in entries.values()
+    ]
+    for entry in deleted:
+        entry.delete()
+    trace(f"Removed {len(deleted)} entries with task name '{target_task.name}'")
 
 
 @Command(Group.COMBINE, ['combine'])
@@ -465,7 +500,7 @@ def set_entry_description(entry: Entry, text: str):
 def fix_all_entries_description():
     """Replace all consecutive space characters in entry description with a single one"""
     fixed = 0
-    for entry in list(Entry.all.values()):
+    for entry in Entry.all.values():
         fixed += entry.fix_whitespace()
     trace(f"Fixed whitespace in descriptions of {fixed} entries")
 
@@ -484,7 +519,7 @@ def apply_jira_formatting(entry: Entry):
 def apply_jira_formatting_for_all():
     """Generate Jira markup from entry description for all entries"""
     generated = 0
-    for entry in list(Entry.all.values()):
+    for entry in Entry.all.values():
         result = entry.gen_markup()
         if result is True:
             generated += 1
@@ -503,36 +538,37 @@ def log_work(entry: Entry) -> bool:
     Jira.login(*CONFIG.credentials.jira.values())
 
     was_logged = entry.logged()
-    if was_logged:
-        entry.remove_jira_log()
+    if was_logged and entry.remove_jira_log() is False:
+        # Adding a worklog while the old one is still in place would duplicate it
+        print(f"[ERROR] Entry '{entry}' old worklog is not removed, skipping")
+        return False
 
     result = entry.log_to_jira()
     if result is True:
-        trace(
-            f"{'Adjusted' if was_logged else 'Logged'} work:"
-            f" {entry.task.jira}"
-            f" ({entry.day} {entry.start.hour:02}:{entry.start.minute:02})"
-            f" [{entry.duration}]: {entry.description}"
-        )
+        _trace_worklog_(entry, was_logged)
     return result
 
 
+def _trace_worklog_(entry: Entry, was_logged: bool):
+    trace(
+        f"{'Adjusted' if was_logged else 'Logged'} work:"
+        f" {entry.task.jira}"
+        f" ({entry.day} {entry.start.hour:02}:{entry.start.minute:02})"
+        f" [{entry.duration}]: {entry.description}"
+    )
+
+
 @Command(Group.JIRA, ['log'])
 def log_all():
     """Add worklog of all loaded entries to Jira"""
-    logged = 0
-    failed = 0
-
     Jira.login(*CONFIG.credentials.jira.values())
 
-    for entry in Entry.all.values():
-        result = log_work(entry)
-        if result is True:
-            logged += 1
-        else:
-            failed += 1
+    logged = Entry.log_all_to_jira(Entry.all.values())
+    for entry, was_logged in logged:
+        _trace_worklog_(entry, was_logged)
+    failed = len(Entry.all) - len(logged)
 
-    summary = f"Added worklog to Jira for {logged} entries"
+    summary = f"Added worklog to Jira for {len(logged)} entries"
     if failed > 0:
         summary += f", failed {failed} entries"
     print(summary)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
+import re
 import tomllib
 from pathlib import Path
-from typing import Any
+from re import Pattern
+from typing import Any, ClassVar
 
-from tools import constricted_repr
+from tools import constricted_repr, parse_json
 
 
 class ConfigDict(dict[str, Any]):
@@ -25,7 +26,12 @@ class ConfigDict(dict[str, Any]):
             return value
 
     def __getattr__(self, name: str) -> Any:
-        return self.__getitem__(name)
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
+        try:
+            return self.__getitem__(name)
+        except KeyError:
+            raise AttributeError(f"Config has no '{name}' option") from None
 
     def __setattr__(self, name: str, value: Any):
         raise AttributeError(f"'{self.__class__.__name__}' object is read-only")
@@ -70,6 +76,8 @@ class DictLoader(ConfigLoader):
 class FileLoader(ConfigLoader):
     filepath: Path
 
+    cache: ClassVar[dict[tuple[type[FileLoader], Path, int], Any]] = {}
+
     def __init__(self, file_path: str):
         path = Path(file_path)
         if not path.exists():
@@ -83,42 +91,47 @@ class FileLoader(ConfigLoader):
         return f"<{self.__class__.__qualname__} file=\"{self.filepath.as_posix()}\">"
 
     def load(self) -> Any:
+        """Read the file, reusing the previous result while the file is not modified"""
+        key = (self.__class__, self.filepath, self.filepath.stat().st_mtime_ns)
+        if key not in self.cache:
+            self.cache[key] = self._read_()
+        return self.cache[key]
+
+    def _read_(self) -> Any:
         raise NotImplementedError
 
 
 class StringLoader(FileLoader):
-    def load(self) -> str:
+    def _read_(self) -> str:
         with self.filepath.open(encoding='utf-8') as file:
             value = file.read()
         return value.strip()
 
 
 class KeyValueLoader(FileLoader):
-    @staticmethod
-    def _validate_key_(key: str):
-        if not key.isidentifier():
-            raise ValueError(f"Invalid key: {key}")
+    # 'key = value' line, where key is an identifier and blanks do not span lines
+    # Separator is ' = ' exactly, surrounding blanks are stripped
+    pattern: ClassVar[Pattern[str]] = re.compile(
+        r'^[^\S\n]*(?P<key>[^\W\d]\w*)[^\S\n]* = [^\S\n]*(?P<value>.*?)[^\S\n]*$',
+        re.MULTILINE,
+    )
 
-    def load(self) -> ConfigDict:
-        config = ConfigDict()
-        with self.filepath.open(encoding='utf-8') as file:
-            for line in file:
-                key, value = line.split(' = ', 1)
-                key = key.strip()
-                self._validate_key_(key)
-                config[key] = value.strip()
-        return config
+    def _read_(self) -> ConfigDict:
+        data = self.filepath.read_text(encoding='utf-8')
+        matches = self.pattern.findall(data)
+        # Every line has to be a valid 'key = value' pair
+        if len(matches) != len(data.splitlines()):
+            raise ValueError(f"Invalid key-value config file: '{self.filepath.name}'")
+        return ConfigDict(matches)
 
 
 class JsonLoader(FileLoader):
-    def load(self) -> ConfigDict:
-        with self.filepath.open(encoding='utf-8') as file:
-            data = json.load(file)
-        return ConfigDict(data)
+    def _read_(self) -> ConfigDict:
+        return ConfigDict(parse_json(self.filepath.read_bytes()))
 
 
 class TomlLoader(FileLoader):
-    def load(self) -> ConfigDict:
+    def _read_(self) -> ConfigDict:
         with self.filepath.open(mode='rb') as file:
             data = tomllib.load(file)
         return ConfigDict(data)
@@ -2,21 +2,23 @@ from __future__ import annotations
 
 import re
 import sys
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from itertools import count as counter
-from itertools import groupby
-from typing import Callable, ClassVar, Iterable, NewType, Self, Sequence
+from operator import attrgetter
+from re import Pattern
+from typing import Any, ClassVar, Iterable, Iterator, NewType, Self, Sequence
 
-from adapter import GenericEntry
+from adapter import BackendDataError, GenericEntry
 from alias import Alias
 from api import BackendData
 from cache import CacheManager
 from config import CONFIG, trace
-from jira_client import Jira
+from jira_client import Jira, WorklogSpec
 from jira_formatter import JiraFormatter
-from task import Task, TaskId, TaskType
-from tools import TODAY, Format, first_word, round_bounds, timespan_to_duration
+from task import JiraId, Task, TaskId, TaskType
+from tools import TODAY, AppError, Format, oneline, round_bounds, timespan_to_duration
 
 
 match CONFIG.backend:
@@ -43,13 +45,17 @@ class Entry:
     text: str
     markup: str | None = None
     worklog_id: int = 0
+    # Date of 'start', updated every time 'start' is assigned
+    day: date = field(init=False, repr=False, compare=False)
 
     all: ClassVar[dict[Alias, Entry]] = {}
+    by_day: ClassVar[dict[date, dict[Alias, Entry]]] = {}
+    days: ClassVar[list[date]] = []
+    by_task: ClassVar[dict[Task, dict[Alias, Entry]]] = {}
     formatter: ClassVar[JiraFormatter] = JiraFormatter()
-
-    @property
-    def day(self) -> date:
-        return self.start.date()
+    spaces_pattern: ClassVar[Pattern[str]] = re.compile(r' {2,}')
+    # First word of any line ends with '-ing'
+    gerund_pattern: ClassVar[Pattern[str]] = re.compile(r'^\s*\S*ing(?!\S)', re.MULTILINE)
 
     @property
     def span(self) -> timedelta:
@@ -62,12 +68,14 @@ class Entry:
     @property
     def description(self) -> str:
         description = self.markup if self.markup is not None else self.text
-        return ' | '.join(description.splitlines())
+        return oneline(description)
 
     @classmethod
     def gen(cls, generic_entry: GenericEntry) -> Entry:
         task_id: TaskId = TaskId(generic_entry.task)
-        assert task_id in Task.all
+        task: Task | None = Task.all.get(task_id)
+        if task is None:
+            raise BackendDataError(f"Entry {generic_entry.id}: unknown task {task_id}")
 
         start, end = round_bounds(generic_entry.start, generic_entry.end)
         assert start <= end
@@ -75,16 +83,25 @@ class Entry:
         entry_id: int = generic_entry.id
         text: str = generic_entry.description
 
-        return cls(EntryId(entry_id), Task.all[task_id], start, end, text)
+        return cls(EntryId(entry_id), task, start, end, text)
 
     @classmethod
     def fetch(cls, since: date, until: date, validate: bool = True):
         """Download entries from server, store them to cache and load into application"""
 
-        trace(f"Fetching entries for {(until-since).days} days...")
-        raw_entries: Sequence[BackendData] = Server.get_entries(since, until)
-        CacheManager.save(raw_entries)
-        cls._reload_(raw_entries, check_health=validate)
+        trace(f"Fetching entries for {(until - since).days + 1} days...")
+        cls._store_(Server.get_entries(since, until), validate=validate)
+
+    @classmethod
+    def fetch_all(cls, since: date, until: date, validate: bool = True):
+        """Download tasks and entries concurrently, store them to cache and load both"""
+
+        trace(f"Fetching tasks and entries for {(until - since).days + 1} days...")
+        raw_tasks, raw_entries = Server.get_data(since, until)
+        # Entries refer to tasks, so tasks have to be loaded first
+        # pylint: disable=protected-access
+        Task._store_(raw_tasks, validate=validate)
+        cls._store_(raw_entries, validate=validate)
 
     @classmethod
     def load(cls, since: date, until: date, validate: bool = True):
@@ -96,28 +113,42 @@ class Entry:
     def combine(cls, entries: Iterable[Entry]) -> int:
         deleted = 0
 
-        sorted_entries: list[Entry] = sorted(entries, key=cls._grouping_order_)
-        for key, group in groupby(sorted_entries, key=cls._grouping_order_):
-            fragments: list[Entry] = sorted(group, key=lambda e: e.start)
+        groups: dict[tuple[date, int, str], list[Entry]] = defaultdict(list)
+        for entry in entries:
+            groups[cls._grouping_order_(entry)].append(entry)
+
+        for fragments in groups.values():
+            if len(fragments) == 1:
+                continue
             total_duration: timedelta = sum((e.span for e in fragments), start=timedelta())
-            composite_entry = fragments[0]
+            composite_entry = min(fragments, key=attrgetter('start'))
             composite_entry.end = composite_entry.start + total_duration
-            for entry in fragments[1:]:
-                entry.delete()
-                deleted += 1
+            for entry in fragments:
+                if entry is not composite_entry:
+                    entry.delete()
+                    deleted += 1
 
         return deleted
 
     @classmethod
     def combine_for(cls, since: date, until: date) -> int:
-        range_filter: Callable[[Entry], bool] = lambda e: since <= e.start.date() <= until
-        return cls.combine(filter(range_filter, Entry.all.values()))
+        return cls.combine(cls.within(since, until))
+
+    @classmethod
+    def within(cls, since: date, until: date) -> Iterator[Entry]:
+        """Iterate over entries within the specified interval of days, day by day"""
+        start = bisect_left(cls.days, since)
+        stop = bisect_right(cls.days, until)
+        for day in cls.days[start:stop]:
+            yield from cls.by_day[day].values()
 
     @classmethod
     def all_tasks(cls) -> list[Task]:
         tasks: list[Task] = []
+        seen: set[JiraId | None] = set()
         for entry in cls.all.values():
-            if all(task.jira != entry.task.jira for task in tasks):
+            if entry.task.jira not in seen:
+                seen.add(entry.task.jira)
                 tasks.append(entry.task)
         return tasks
 
@@ -129,10 +160,20 @@ class Entry:
 
     def delete(self):
         del self.__class__.all[self.alias]
+        self._unindex_()
+
+    @classmethod
+    def _store_(cls, raw_entries: Sequence[BackendData], *, validate: bool):
+        """Store downloaded entries to cache and load them into application"""
+        CacheManager.save(raw_entries)
+        cls._reload_(raw_entries, check_health=validate)
 
     @classmethod
     def _reload_(cls, raw_entries: Sequence[BackendData], *, check_health: bool):
         cls.all.clear()
+        cls.by_day.clear()
+        cls.days.clear()
+        cls.by_task.clear()
         for raw_entry in raw_entries:
             generic_entry: GenericEntry = Adapter.parse_entry(raw_entry)
 
@@ -153,13 +194,13 @@ class Entry:
         if not self.text and self.task.type is TaskType.TICKET:
             print(f"[WARNING] Entry '{self}' has no description")
             healthy = False
-        if self.start.date() > TODAY or self.end.date() > TODAY:
+        if self.day > TODAY or self.end.date() > TODAY:
             print(f"[WARNING] Entry '{self}' day is invalid: {self.day}")
             healthy = False
-        if self.start.date() != self.end.date():
+        if self.day != self.end.date():
             print(f"[WARNING] Entry '{self}' spans across multiple days")
             healthy = False
-        if any(first_word(line).endswith('ing') for line in self.text.splitlines()):
+        if self.gerund_pattern.search(self.text):
             print(f"[WARNING] Entry '{self}' description is not imperative")
             healthy = False
         if self.task.name == "MR" and not self.text:
@@ -168,7 +209,9 @@ class Entry:
         return healthy
 
     def fix_whitespace(self) -> bool:
-        fixed_text, count = re.subn(r' {2,}', ' ', self.text)
+        if '  ' not in self.text:
+            return False
+        fixed_text, count = self.spaces_pattern.subn(' ', self.text)
         if count > 0:
             self.text = fixed_text
             return True
@@ -176,17 +219,59 @@ class Entry:
 
     @classmethod
     def gen_id(cls, reference: Self) -> EntryId:
-        for i in counter(1):
-            new_id = EntryId(reference.id + i)
-            if all(entry.id != new_id for entry in cls.all.values()):
-                return new_id
-        return EntryId(reference.id)
+        taken = {entry.id for entry in cls.all.values()}
+        new_id = reference.id + 1
+        while new_id in taken:
+            new_id += 1
+        return EntryId(new_id)
 
     def gen_markup(self) -> bool:
         self.markup = self.formatter.format(self.task, self.text)
         return bool(self.markup)
 
     def log_to_jira(self) -> bool:
+        if self._check_jira_log_() is False:
+            return False
+
+        worklog = Jira.add_worklog(*self._worklog_spec_())
+
+        if worklog is None:
+            return False
+
+        self.worklog_id = worklog.id
+        return True
+
+    @classmethod
+    def log_all_to_jira(cls, entries: Iterable[Entry]) -> list[tuple[Entry, bool]]:
+        """Add worklogs concurrently, return logged entries with 'replaced' flags"""
+        pending: list[tuple[Entry, bool]] = []
+        for entry in entries:
+            if entry._check_jira_log_() is False:
+                continue
+            pending.append((entry, entry.logged()))
+
+        replaced = [entry for entry, was_logged in pending if was_logged]
+        deleted = Jira.delete_worklogs([entry._worklog_ref_() for entry in replaced])
+        for entry, success in zip(replaced, deleted):
+            if success is True:
+                entry.worklog_id = 0
+            else:
+                print(f"[ERROR] Entry '{entry}' old worklog is not removed, skipping")
+        # Entries whose old worklog is still in place are left out to avoid duplicates
+        pending = [
+            (entry, was_logged) for entry, was_logged in pending if not entry.logged()
+        ]
+
+        worklogs = Jira.add_worklogs([entry._worklog_spec_() for entry, _ in pending])
+
+        logged: list[tuple[Entry, bool]] = []
+        for (entry, was_logged), worklog in zip(pending, worklogs):
+            if worklog is not None:
+                entry.worklog_id = worklog.id
+                logged.append((entry, was_logged))
+        return logged
+
+    def _check_jira_log_(self) -> bool:
         if self.task.jira is None:
             print(f"[ERROR] Entry '{self}' has no Jira task")
             return False
@@ -195,13 +280,15 @@ class Entry:
             print(f"[ERROR] Entry '{self}' is not formatted")
             return False
 
-        worklog = Jira.add_worklog(self.task.jira, self.duration, self.start, self.markup)
+        return True
 
-        if worklog is None:
-            return False
+    def _worklog_ref_(self) -> tuple[str, int]:
+        assert self.task.jira is not None
+        return self.task.jira, self.worklog_id
 
-        self.worklog_id = worklog.id
-        return True
+    def _worklog_spec_(self) -> WorklogSpec:
+        assert self.task.jira is not None and self.markup is not None
+        return self.task.jira, self.duration, self.start, self.markup
 
     def remove_jira_log(self) -> bool:
         if self.task.jira is None:
@@ -211,7 +298,8 @@ class Entry:
         if self.logged() is False:
             return False
 
-        Jira.delete_worklog(self.task.jira, self.worklog_id)
+        if Jira.delete_worklog(self.task.jira, self.worklog_id) is False:
+            return False
 
         self.worklog_id = 0
         return True
@@ -219,27 +307,70 @@ class Entry:
     def __post_init__(self):
         self.alias = self._gen_alias_()
         self.__class__.all[self.alias] = self
+        self._index_()
+
+    def __setattr__(self, name: str, value: Any):
+        # Note: zero-argument super() does not work in slotted dataclasses
+        if name != 'start' and name != 'task':
+            object.__setattr__(self, name, value)
+        elif self._moved_(name, value) and self.all.get(self.alias) is self:
+            # Keep indexes in sync when registered entry is moved to another day or task
+            self._unindex_()
+            self._assign_(name, value)
+            self._index_()
+        else:
+            self._assign_(name, value)
+
+    def _moved_(self, name: str, value: Any) -> bool:
+        if not hasattr(self, 'alias'):
+            return False
+        if name == 'start':
+            return value.date() != self.day
+        return value is not self.task
+
+    def _assign_(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name == 'start':
+            object.__setattr__(self, 'day', value.date())
+
+    def _index_(self):
+        if self.day not in self.by_day:
+            self.by_day[self.day] = {}
+            insort(self.days, self.day)
+        self.by_day[self.day][self.alias] = self
+        self.by_task.setdefault(self.task, {})[self.alias] = self
+
+    def _unindex_(self):
+        daily_entries = self.by_day[self.day]
+        del daily_entries[self.alias]
+        if not daily_entries:
+            del self.by_day[self.day]
+            del self.days[bisect_left(self.days, self.day)]
+        task_entries = self.by_task[self.task]
+        del task_entries[self.alias]
+        if not task_entries:
+            del self.by_task[self.task]
 
     def __str__(self):
         task = self.task.name
         if self.task.jira is not None:
             task = f"[{self.task.jira}] {task}"
         if self.text:
-            description = ' | '.join(self.text.splitlines())
-            task = f"{task}: {description}"
+            task = f"{task}: {oneline(self.text)}"
         start_time = f"{self.start.hour:02}:{self.start.minute:02}"
         return f"{self.alias}: {task} ({self.day} {start_time} {self.duration})"
 
-    def _gen_alias_(self, entry_id: int | None = None) -> Alias:
-        seed = entry_id or self.id
-        alias = Alias.gen(seed)
-        if alias in self.all.keys():
-            return self._gen_alias_(seed + 1)
-        return alias
+    def _gen_alias_(self) -> Alias:
+        # Seeds within one capacity span map to distinct aliases, so this probes each once
+        for seed in range(self.id, self.id + Alias.capacity()):
+            alias = Alias.gen(seed)
+            if alias not in self.all:
+                return alias
+        raise AppError(f"Cannot generate alias for entry {self.id}: all aliases are taken")
 
     @staticmethod
     def _grouping_order_(entry: Entry) -> tuple[date, int, str]:
-        return (entry.start.date(), entry.task.id, entry.text)
+        return (entry.day, entry.task.id, entry.text)
 
 
 if __name__ == '__main__':
@@ -247,8 +378,7 @@ if __name__ == '__main__':
         case ['fetch']:
             credentials = CONFIG.credentials.timecamp
             Server.login(credentials)
-            Task.fetch()
-            Entry.fetch(since=date(2023, 3, 6), until=date(2023, 3, 7))
+            Entry.fetch_all(since=date(2023, 3, 6), until=date(2023, 3, 7))
             Server.logout()
             print(*Entry.all.values(), sep='\n')
 
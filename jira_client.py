@@ -4,16 +4,20 @@ Jira package docs: https://jira.readthedocs.io
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import ClassVar
+from typing import ClassVar, List, Sequence, Tuple
 
 from jira import JIRA, JIRAError, Worklog
 
 from config import CONFIG
 
 
+WorklogSpec = Tuple[str, str, datetime, str]
+
+
 @dataclass
 class TimeEstimate:
     estimated: int
@@ -23,6 +27,7 @@ class TimeEstimate:
 
 class Jira:
     URL: ClassVar[str] = "https://teltonika-telematics.atlassian.net"
+    MAX_REQUESTS: ClassVar[int] = 8
 
     _server_: ClassVar[JIRA | None] = None
 
@@ -48,19 +53,75 @@ class Jira:
                 task_id, timeSpent=duration, started=started, comment=comment
             )
         except JIRAError as exception:
-            print("[ERROR] Failed to add Jira worklog")
-            print(exception)
+            cls._report_error_("add", exception)
             return None
 
     @classmethod
-    def delete_worklog(cls, task_id: str, worklog_id: int):
+    def add_worklogs(cls, worklogs: Sequence[WorklogSpec]) -> List[Worklog | None]:
+        """Add worklogs concurrently, return results in the order of requests"""
+        assert cls._server_ is not None
+        server = cls._server_
+
+        with ThreadPoolExecutor(max_workers=cls.MAX_REQUESTS) as executor:
+            futures = [
+                executor.submit(
+                    server.add_worklog,
+                    task_id, timeSpent=duration, started=started, comment=comment
+                )
+                for task_id, duration, started, comment in worklogs
+            ]
+
+        # Report failures from the calling thread to keep the output in order
+        # Any failure is reported per worklog, so that created worklogs are never lost
+        results: List[Worklog | None] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exception:  # pylint: disable=broad-except
+                cls._report_error_("add", exception)
+                results.append(None)
+        return results
+
+    @staticmethod
+    def _report_error_(action: str, exception: Exception):
+        print(f"[ERROR] Failed to {action} Jira worklog")
+        print(exception)
+
+    @classmethod
+    def delete_worklog(cls, task_id: str, worklog_id: int) -> bool:
+        try:
+            cls._delete_worklog_(task_id, worklog_id)
+        except JIRAError as exception:
+            cls._report_error_("delete", exception)
+            return False
+        return True
+
+    @classmethod
+    def delete_worklogs(cls, worklogs: Sequence[Tuple[str, int]]) -> List[bool]:
+        """Delete (task id, worklog id) pairs concurrently, return success flags in order"""
+        assert cls._server_ is not None
+        with ThreadPoolExecutor(max_workers=cls.MAX_REQUESTS) as executor:
+            futures = [executor.submit(cls._delete_worklog_, *ref) for ref in worklogs]
+
+        # Any failure is reported per worklog, so that completed deletions are never lost
+        results: List[bool] = []
+        for future in futures:
+            try:
+                future.result()
+                results.append(True)
+            except Exception as exception:  # pylint: disable=broad-except
+                cls._report_error_("delete", exception)
+                results.append(False)
+        return results
+
+    @classmethod
+    def _delete_worklog_(cls, task_id: str, worklog_id: int):
         assert cls._server_ is not None
-        # TODO: Handle exceptions
         worklog = cls._server_.worklog(issue=task_id, id=worklog_id)
         worklog.delete()
 
     @classmethod
-    @lru_cache(maxsize=16)
+    @lru_cache(maxsize=256)
     def get_timetracking(cls, task_id: str) -> TimeEstimate | None:
         assert cls._server_ is not None
         assert task_id is not None
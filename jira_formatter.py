@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 import sys
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cached_property, lru_cache
 from re import Match, Pattern
 from typing import Any, ClassVar, Iterable, Type, TypeAlias
 
@@ -23,6 +23,8 @@ class Markup:
 
     all: ClassVar[dict[str, Type[Markup]]] = {}
     pattern: ClassVar[Pattern[str]]
+    # Markup changes only text matching its pattern
+    substitution: ClassVar[bool] = True
 
     def __init_subclass__(cls, /, name: str, **kwargs: Any):
         super().__init_subclass__(**kwargs)
@@ -57,7 +59,9 @@ class URLMarkup(Markup, name='url'):
 
 
 class UserMarkup(Markup, name='user'):
-    pattern: ClassVar[Pattern[str]] = re.compile(r'@([A-z]+(?:\.[A-z]+)?)')
+    pattern: ClassVar[Pattern[str]] = re.compile(
+        r'@([A-Za-z_]+(?:\.[A-Za-z_]+)?)', re.ASCII
+    )
 
     users: dict[str, str]
 
@@ -73,7 +77,7 @@ class UserMarkup(Markup, name='user'):
             return match.group(0)
 
     def apply(self, task: Task, text: str) -> Markup.Result:
-        output, substitutions = re.subn(self.pattern, self._format_user_, text)
+        output, substitutions = self.pattern.subn(self._format_user_, text)
         return Markup.Result(output, substitutions)
 
 
@@ -89,7 +93,8 @@ class MRLinkMarkup(Markup, name='mr-link'):
             r'(?P<url_query>\?{id}={id})?'
             r'(?P<url_params>&{id}={id})*'
             r'(?P<url_fragment>#{id})?'
-        ).format(gitlab_base_url=re.escape(BASE_URL), id=r'[\w-]+')
+        ).format(gitlab_base_url=re.escape(BASE_URL), id=r'[A-Za-z0-9_-]+'),
+        re.ASCII,
     )
 
     projects: dict[str, str]
@@ -108,11 +113,13 @@ class MRLinkMarkup(Markup, name='mr-link'):
         return f"[{short_link}|{match.group(0)}]"
 
     def apply(self, task: Task, text: str) -> Markup.Result:
-        output, substitutions = re.subn(self.pattern, self._format_project_, text)
+        output, substitutions = self.pattern.subn(self._format_project_, text)
         return Markup.Result(output, substitutions)
 
 
 class MRReviewMarkup(MRLinkMarkup, name='mr-review'):
+    substitution: ClassVar[bool] = False
+
     def apply(self, task: Task, text: str) -> Markup.Result:
         if not self.pattern.fullmatch(text):
             return Markup.Result(text, 0)
@@ -122,13 +129,15 @@ class MRReviewMarkup(MRLinkMarkup, name='mr-review'):
 
 
 class SprintMeetingMarkup(Markup, name='meeting'):
-    @classmethod
-    def _is_meeting_task_(cls, task: Task | None) -> bool:
-        if task is None:
-            return False
-        if task.name == "Meeting":
-            return True
-        return cls._is_meeting_task_(task.parent)
+    substitution: ClassVar[bool] = False
+
+    @staticmethod
+    def _is_meeting_task_(task: Task | None) -> bool:
+        while task is not None:
+            if task.name == "Meeting":
+                return True
+            task = task.parent
+        return False
 
     def apply(self, task: Task, text: str) -> Markup.Result:
         # TODO: refactor this and remove _is_meeting_task_() method
@@ -150,6 +159,12 @@ class SprintMeetingMarkup(Markup, name='meeting'):
         return Markup.Result(output, 1, complete=True)
 
 
+@lru_cache(maxsize=None)
+def build_markups(names: tuple[str, ...]) -> tuple[Markup, ...]:
+    """Instantiate markups in the given order, sharing them between formatters"""
+    return tuple(Markup.all[name]() for name in names)
+
+
 class JiraFormatter:
     DEFAULT_FORMATTERS: ClassVar[list[str]] = [
         'mr-review',
@@ -170,12 +185,28 @@ class JiraFormatter:
         self.formatters = list(formatters)
 
     @cached_property
-    def markups(self) -> list[Markup]:
-        return [Markup.all[formatter]() for formatter in self.formatters]
+    def markups(self) -> tuple[Markup, ...]:
+        return build_markups(tuple(self.formatters))
+
+    @cached_property
+    def trigger(self) -> Pattern[str]:
+        """Union of substitution markup patterns to check if any of them may apply"""
+        patterns = (self._scoped_(m.pattern) for m in self.markups if m.substitution)
+        return re.compile('|'.join(patterns))
+
+    @staticmethod
+    def _scoped_(pattern: Pattern[str]) -> str:
+        # Keep ASCII-only patterns ASCII-only within the union
+        flags = 'a' if pattern.flags & re.ASCII else ''
+        return f'(?{flags}:{pattern.pattern})'
 
     def format(self, task: Task, text: str) -> str:
         output = text
+        # Text with no pattern matches is left intact by all substitution markups
+        plain = self.trigger.search(text) is None
         for markup in self.markups:
+            if plain and markup.substitution:
+                continue
             result = markup.apply(task, output)
             if result.complete is True:
                 return result.text
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import os
+import shutil
 import sys
-from bisect import insort
 from collections import defaultdict
-from datetime import date, timedelta
+from datetime import date, time, timedelta
 from itertools import groupby
-from typing import Callable, ClassVar, Collection, Dict, List
+from typing import ClassVar, Collection, Dict, List
 
 from config import CONFIG
 from entry import Entry
@@ -21,14 +20,17 @@ GAP = " " * 3
 
 class Table:
     widths: ClassVar[Dict[str, int]] = defaultdict(int)
+    # Seconds spent on each Jira task across all entries, refreshed every frame
+    spent: ClassVar[Dict[JiraId, int]] = defaultdict(int)
     scrollback: ClassVar[bool] = CONFIG.scrollback
     show_estimates: ClassVar[bool] = CONFIG.jira_estimates
     stored_interval: ClassVar[tuple[date, date] | None] = None
     targets: ClassVar[List[timedelta | None]] = []
 
     @staticmethod
-    def _display_order_(entry: Entry) -> date:
-        return entry.start.date()
+    def _display_order_(entry: Entry) -> time:
+        # Entries are ordered within a day, so time of day is enough
+        return entry.start.time()
 
     @staticmethod
     def _get_status_glyph_(entry: Entry) -> str:
@@ -41,22 +43,25 @@ class Table:
     @classmethod
     def _set_column_widths_(cls):
         cls.widths.clear()
-        for entry in Entry.all.values():
-            if (jira_width := len(str(entry.task.jira))) > cls.widths['jira']:
+        # Widths depend on entry tasks only, so scan distinct tasks instead of all entries
+        for task in Entry.by_task:
+            if (jira_width := len(str(task.jira))) > cls.widths['jira']:
                 cls.widths['jira'] = jira_width
-            if (taskname_width := len(entry.task.name)) > cls.widths['task']:
+            if (taskname_width := len(task.name)) > cls.widths['task']:
                 cls.widths['task'] = taskname_width
+        # TODO: calculate width left for description dynamically
+        # Falls back to default size when output is not a terminal
+        console_width = shutil.get_terminal_size().columns
+        other_widths = cls.widths['jira'] + len(GAP) + cls.widths['task'] + 38
+        cls.widths['description'] = console_width - other_widths
 
     @classmethod
     def _trunc_description_(cls, description: str) -> str:
-        # TODO: calculate width left for description dynamically
-        console_width = os.get_terminal_size().columns
-        max_width = console_width - cls.widths['jira'] - len(GAP) - cls.widths['task'] - 38
-        return constrict(description, width=max_width)
+        return constrict(description, width=cls.widths['description'])
 
     @classmethod
     def list(cls, entries: List[Entry]):
-        for current_date, daily_entries in groupby(entries, key=lambda e: e.start.date()):
+        for current_date, daily_entries in groupby(entries, key=lambda e: e.day):
             print(current_date)
             for entry in daily_entries:
                 print(entry)
@@ -85,8 +90,9 @@ class Table:
     def group_by_days(cls, entries: Collection[Entry]) -> Dict[date, List[Entry]]:
         entries_grouped: Dict[date, List[Entry]] = defaultdict(list)
         for entry in entries:
-            entries_list = entries_grouped[entry.start.date()]
-            insort(entries_list, entry, key=cls._display_order_)
+            entries_grouped[entry.day].append(entry)
+        for entries_list in entries_grouped.values():
+            entries_list.sort(key=cls._display_order_)
         return entries_grouped
 
     @classmethod
@@ -96,14 +102,17 @@ class Table:
     @classmethod
     def display_grouped(cls, entries: Collection[Entry]):
         cls._set_column_widths_()
-
-        if cls.scrollback is False:
-            print(TOP_SCROLL_SEQUENCE, end="")
+        if cls.show_estimates is True:
+            cls._set_time_spent_()
 
         total_duration = cls.get_total_duration(entries)
         entries_grouped = cls.group_by_days(entries)
 
-        print(f"Total - {len(entries)} entries - {timespan_to_duration(total_duration)}")
+        # Collect the frame to write it out at once
+        total = timespan_to_duration(total_duration)
+        lines: List[str] = [f"Total - {len(entries)} entries - {total}"]
+        if cls.scrollback is False:
+            lines[0] = TOP_SCROLL_SEQUENCE + lines[0]
         for i, (curr_date, daily_entries) in enumerate(sorted(entries_grouped.items())):
             daily_total = sum((entry.span for entry in daily_entries), start=timedelta())
             daily_duration = timespan_to_duration(daily_total)
@@ -117,9 +126,16 @@ class Table:
                 if target_duration is not None:
                     daily_header += f" ({timespan_to_duration(target_duration)} target)"
 
-            print(daily_header)
+            lines.append(daily_header)
             for entry in daily_entries:
-                print(cls.format_row(entry))
+                lines.append(cls.format_row(entry))
+                if cls.show_estimates is True:
+                    # Rows wait for slow Jira lookups that may fail, so show them early
+                    print('\n'.join(lines))
+                    lines.clear()
+
+        if lines:
+            print('\n'.join(lines))
 
     @classmethod
     def display_all(cls):
@@ -128,8 +144,7 @@ class Table:
 
     @classmethod
     def display_for(cls, since: date, until: date):
-        within_bounds: Callable[[Entry], bool] = lambda entry: since <= entry.day <= until
-        cls.display_grouped(list(filter(within_bounds, Entry.all.values())))
+        cls.display_grouped(list(Entry.within(since, until)))
         cls.stored_interval = (since, until)
 
     @classmethod
@@ -171,14 +186,16 @@ class Table:
                 sep=GAP,
             )
 
+    @classmethod
+    def _set_time_spent_(cls):
+        cls.spent.clear()
+        for entry in Entry.all.values():
+            if entry.task.jira is not None:
+                cls.spent[entry.task.jira] += int(entry.span.total_seconds())
+
     @classmethod
     def _get_time_spent_(cls, jira_id: JiraId) -> timedelta:
-        spent = sum(
-            int(entry.span.total_seconds())
-            for entry in Entry.all.values()
-            if entry.task.jira == jira_id
-        )
-        return timedelta(seconds=spent)
+        return timedelta(seconds=cls.spent[jira_id])
 
     @classmethod
     def _format_time_remaining_(cls, entry: Entry) -> str:
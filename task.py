@@ -69,9 +69,7 @@ class Task:
     def fetch(cls, validate: bool = True):
         """Download tasks from server, store them to cache and load into application"""
         trace("Fetching tasks...")
-        raw_tasks: Sequence[BackendData] = Server.get_tasks()
-        CacheManager.save(raw_tasks)
-        cls._reload_(raw_tasks, check_health=validate)
+        cls._store_(Server.get_tasks(), validate=validate)
 
     @classmethod
     def load(cls, validate: bool = True):
@@ -79,6 +77,12 @@ class Task:
         raw_tasks: Sequence[BackendData] = CacheManager.load_tasks()
         cls._reload_(raw_tasks, check_health=validate)
 
+    @classmethod
+    def _store_(cls, raw_tasks: Sequence[BackendData], *, validate: bool):
+        """Store downloaded tasks to cache and load them into application"""
+        CacheManager.save(raw_tasks)
+        cls._reload_(raw_tasks, check_health=validate)
+
     @classmethod
     def _reload_(cls, raw_tasks: Sequence[BackendData], *, check_health: bool):
         cls.all.clear()
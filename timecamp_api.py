@@ -34,12 +34,14 @@ class Timecamp(Backend):
     API = 'https://app.timecamp.com/third_party/api'
 
     @classmethod
-    def login(cls, credentials: Credentials):
-        super().login(credentials)
+    def login(cls, credentials: Credentials) -> bool:
+        if super().login(credentials) is False:
+            return False
         assert cls._session_ is not None
 
         cls._session_.headers.update({'Content-Type': 'application/json'})
         cls._session_.headers.update({'Authorization': credentials['key']})
+        return True
 
     @classmethod
     def logout(cls):
@@ -3,7 +3,8 @@ from __future__ import annotations
 import re
 import sys
 from datetime import datetime
-from typing import Dict, List, Sequence, Tuple, cast
+from functools import lru_cache
+from typing import Dict, Sequence, Tuple, cast
 
 from adapter import BackendAdapter, BackendDataError, GenericEntry, GenericTask
 from api import BackendData
@@ -15,8 +16,9 @@ from tools import CURRENT_TZ, unwrap
 # JIRA_REGEX = re.compile(r'\[([A-Z0-9]+-[0-9]+)\] ')
 # SPEC_REGEX = re.compile(r'\((\w+)\) ')
 TASK_NAME_REGEX = re.compile(
-    r'(?:\[(?P<jira>[A-Z-0-9]+)\])?\s*(?:\((?P<spec>\w+)\))?\s*(?:(?P<title>.+))?'
+    r'(?:\[(?P<jira>[A-Z0-9-]+)\])?\s*(?:\((?P<spec>\w+)\))?\s*(?:(?P<title>.+))?'
 )
+TAG_REGEX = re.compile(r'<\{\{\|(?P<kind>[tm])\|(?P<id>\d+)\|\}\}>')
 
 
 class TimeularAdapter(BackendAdapter):
@@ -69,55 +71,72 @@ class TimeularAdapter(BackendAdapter):
 
         return GenericEntry(entry_id, task_id, start, end, text)
 
-    @staticmethod
-    def _parse_title_(raw_task: TimeularTask) -> Tuple[str, Dict[str, str]]:
+    @classmethod
+    def _parse_title_(cls, raw_task: TimeularTask) -> Tuple[str, Dict[str, str]]:
         # TODO: review the algorithm
 
-        match = TASK_NAME_REGEX.match(raw_task['name'].strip())
+        components = cls._split_name_(raw_task['name'])
 
-        if not match:
+        if components is None:
             error_msg = "Task '{id}': Invalid task name format: '{name}'"
             raise BackendDataError(error_msg.format(**raw_task))
 
-        title = match['title']
+        title, jira, spec = components
         if title is None:
             error_msg = "Task '{id}': Missing task title: '{name}'"
             raise BackendDataError(error_msg.format(**raw_task))
-        title = unwrap(title.strip())
 
+        if spec is not None and jira is None:
+            error_msg = "Task '{id}': Missing jira id: '{name}'"
+            raise BackendDataError(error_msg.format(**raw_task))
+
+        return title, {'jira': jira, 'spec': spec}
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _split_name_(name: str) -> Tuple[str | None, str | None, str | None] | None:
+        """Split task name into title, jira id and spec, memoized by name"""
+        match = TASK_NAME_REGEX.match(name.strip())
+        if not match:
+            return None
+
+        title = match['title']
+        if title is not None:
+            title = unwrap(title.strip())
+
+        # Jira ids and specs come from a small closed set, intern them for fast comparison
         jira = match['jira']
         if jira is not None:
             if '-' not in jira:
                 jira = f"FM64-{jira}"
+            jira = sys.intern(jira)
 
         spec = match['spec']
-        if spec is not None and jira is None:
-            error_msg = "Task '{id}': Missing jira id: '{name}'"
-            raise BackendDataError(error_msg.format(**raw_task))
+        if spec is not None:
+            spec = sys.intern(spec)
 
-        return title, {'jira': jira, 'spec': spec}
+        return title, jira, spec
 
     @classmethod
     def _parse_tags_(cls, raw_entry_note: TimeularEntryNote) -> str:
-        Mentions = List[Dict[str, str | int]]
-
         text: str | None = raw_entry_note['text']
         if text is None:
             return ''
+        if '<{{|' not in text:
+            return text
 
+        labels: Dict[Tuple[str, str], str] = {}
         tags: Sequence[TimeularTag] = raw_entry_note['tags']
         for tag in tags:
-            tag_id = tag['id']
-            label = tag['label']
-            text = text.replace(f"<{{{{|t|{tag_id}|}}}}>", label)
-
+            labels['t', str(tag['id'])] = tag['label']
         mentions: Sequence[TimeularMention] = raw_entry_note['mentions']
         for mention in mentions:
-            tag_id = mention['id']
-            label = mention['label']
-            text = text.replace(f"<{{{{|m|{tag_id}|}}}}>", f"@{label}")
+            labels['m', str(mention['id'])] = f"@{mention['label']}"
+
+        def substitute(match: re.Match[str]) -> str:
+            return labels.get((match['kind'], match['id']), match[0])
 
-        return text
+        return TAG_REGEX.sub(substitute, text)
 
 
 if __name__ == '__main__':
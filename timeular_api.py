@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sys
 from datetime import date, datetime, time
-from typing import Mapping, Sequence, Tuple, TypedDict
+from typing import ClassVar, Mapping, Sequence, Tuple, TypedDict
 
 from api import Backend, Credentials
 from config import CONFIG, trace
@@ -52,9 +52,12 @@ class Timeular(Backend):
 
     API = 'https://api.timeular.com/api/v3'
 
+    _tags_: ClassVar[Tuple[Sequence[TimeularTag], Sequence[TimeularMention]] | None] = None
+
     @classmethod
-    def login(cls, credentials: Credentials):
-        super().login(credentials)
+    def login(cls, credentials: Credentials) -> bool:
+        if super().login(credentials) is False:
+            return False
         assert cls._session_ is not None
         assert 'secret' in credentials
 
@@ -64,12 +67,14 @@ class Timeular(Backend):
 
         cls._session_.headers.update({'Content-Type': 'application/json'})
         cls._session_.headers.update({'Authorization': f"Bearer {response['token']}"})
+        return True
 
     @classmethod
     def logout(cls):
         if cls._session_ is not None:
             response = cls._post_('developer/logout')
             trace(f"Response = {response}")
+        cls._tags_ = None
         super().logout()
 
     @classmethod
@@ -97,6 +102,10 @@ class Timeular(Backend):
 
     @classmethod
     def get_tags(cls) -> Tuple[Sequence[TimeularTag], Sequence[TimeularMention]]:
+        """Request tags and mentions once per session"""
+        if cls._tags_ is not None:
+            return cls._tags_
+
         response = cls._get_('tags-and-mentions')
         assert isinstance(response, Mapping)
 
@@ -106,7 +115,8 @@ class Timeular(Backend):
         mentions: Sequence[TimeularMention] = response['mentions']
         assert isinstance(mentions, Sequence)
 
-        return tags, mentions
+        cls._tags_ = tags, mentions
+        return cls._tags_
 
     @classmethod
     def get_spaces(cls) -> Sequence[TimeularSpace]:
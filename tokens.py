@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from calendar import monthrange
 from datetime import date, datetime, time, timedelta
-from re import Match, Pattern
+from re import ASCII, Match, Pattern
 from re import compile as compile_regex
-from typing import Any, ClassVar, List, NoReturn, Tuple
+from typing import Any, ClassVar, Dict, List, NoReturn, Tuple
 
 from alias import Alias
 from entry import Entry
@@ -20,27 +20,41 @@ class ParseError(AppError):
 
 
 def genspec(**kwargs: str) -> List[FormatSpec]:
-    return [(name, compile_regex(pattern)) for name, pattern in kwargs.items()]
+    return [(name, compile_regex(pattern, ASCII)) for name, pattern in kwargs.items()]
 
 
 class Token:
     match: Match[str] | None
     format: str
+    # Index of the matched format group within the union match
+    offset: int
 
     formatspec: ClassVar[List[FormatSpec]]
+    union: ClassVar[Pattern[str]]
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        alternatives = (f'(?P<{name}>{regex.pattern})' for name, regex in cls.formatspec)
+        cls.union = compile_regex('|'.join(alternatives), ASCII)
 
     def __init__(self) -> None:
         self.match = None
         self.format = ''
+        self.offset = 0
 
     def parse(self, string: str, marker: int) -> bool:
-        for name, regex in self.formatspec:
-            match = regex.match(string, marker)
-            if match is not None:
-                self.match = match
-                self.format = name
-                return True
-        return False
+        match = self.union.match(string, marker)
+        if match is None or match.lastgroup is None:
+            return False
+        self.match = match
+        self.format = match.lastgroup
+        self.offset = self.union.groupindex[self.format]
+        return True
+
+    def group(self, index: int) -> str:
+        """Get group of the matched format by its number within that format"""
+        assert self.match is not None
+        return self.match[self.offset + index]
 
     def evaluate(self) -> Any:
         assert self.match is not None
@@ -83,15 +97,16 @@ class Node(Token):
 
 class Date(Token):
     weeklist: List[str] = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+    weekdays: Dict[str, int] = {name: index for index, name in enumerate(weeklist)}
+    weekdays_regex: str = '|'.join(weeklist)
 
-    # pylint: disable=consider-using-f-string
     formatspec = genspec(
         date=r'\d{4}-\d{2}-\d{2}',
         day=r'\d{1,2}',
         today=r'today',
         yesterday=r'yesterday',
-        week=r'({days})'.format(days='|'.join(weeklist)),
-        lastweek=r'last[- ]({days})'.format(days='|'.join(weeklist)),
+        week=rf'({weekdays_regex})',
+        lastweek=rf'last[- ]({weekdays_regex})',
     )
 
     @staticmethod
@@ -102,7 +117,7 @@ class Date(Token):
 
     @classmethod
     def _weekday_to_date_(cls, weekday: str) -> date:
-        offset = TODAY.weekday() - cls.weeklist.index(weekday)
+        offset = TODAY.weekday() - cls.weekdays[weekday]
         return TODAY - timedelta(days=offset)
 
     def evaluate(self) -> date:
@@ -125,13 +140,13 @@ class Date(Token):
                 return TODAY - timedelta(days=1)
 
             case 'week':
-                weekday = self.match[1]
-                assert weekday in self.weeklist, f"Invalid weekday name '{weekday}'"
+                weekday = self.group(1)
+                assert weekday in self.weekdays, f"Invalid weekday name '{weekday}'"
                 return self._weekday_to_date_(weekday)
 
             case 'lastweek':
-                weekday = self.match[1]
-                assert weekday in self.weeklist, f"Invalid weekday name '{weekday}'"
+                weekday = self.group(1)
+                assert weekday in self.weekdays, f"Invalid weekday name '{weekday}'"
                 return self._weekday_to_date_(weekday) - timedelta(days=7)
 
             case unknown:
@@ -169,7 +184,7 @@ class Week(Token):
                 return self._get_monday_() - timedelta(days=7)
 
             case 'week':
-                offset = int(self.match[1])
+                offset = int(self.group(1))
                 return self._get_monday_() - timedelta(days=7 * offset)
 
             case unknown:
@@ -206,20 +221,20 @@ class Span(Token):
 
         match self.format:
             case 'days':
-                days = int(self.match[1])
+                days = int(self.group(1))
                 return timedelta(days=days)
 
             case 'hourmin':
-                hours = int(self.match[1])
-                seconds = int(self.match[2]) * 60
+                hours = int(self.group(1))
+                seconds = int(self.group(2)) * 60
                 return timedelta(hours=hours, seconds=seconds)
 
             case 'hours':
-                hours = int(self.match[1])
+                hours = int(self.group(1))
                 return timedelta(hours=hours)
 
             case 'minutes' | 'number':
-                seconds = int(self.match[1]) * 60
+                seconds = int(self.group(1)) * 60
                 return timedelta(seconds=seconds)
 
             case unknown:
@@ -235,7 +250,7 @@ class JiraID(Token):
         assert self.match is not None
         assert self.format is not None
 
-        target_jira = self.match[1]
+        target_jira = self.group(1)
         for task in Task.all.values():
             if task.jira == target_jira:
                 return task
@@ -8,8 +8,15 @@ from typing import Any, Callable, Dict, Iterable, Tuple
 from decorator import decorator
 
 
+try:
+    from orjson import loads as parse_json
+except ImportError:
+    from json import loads as parse_json
+
+
 TODAY = date.today()
 CURRENT_TZ = datetime.now().astimezone().tzinfo
+BRACKET_PAIRS = {('(', ')'), ('[', ']'), ('{', '}')}
 
 Config = Dict[str, int | str | bool | Path | dict[str, 'Config'] | None]
 Method = Callable[..., Any]
@@ -55,11 +62,26 @@ def deprecated(func: Method, *args: Any, **kwargs: Any):
     return func(*args, **kwargs)
 
 
+def _is_wrapped_(s: str) -> bool:
+    opening, closing = s[:1], s[-1:]
+    if (opening, closing) not in BRACKET_PAIRS:
+        return False
+    # Opening bracket has to be closed by the last character, not somewhere in between
+    depth = 0
+    for index, char in enumerate(s):
+        if char == opening:
+            depth += 1
+        elif char == closing:
+            depth -= 1
+            if depth == 0:
+                return index == len(s) - 1
+    return False
+
+
 def unwrap(s: str) -> str:
     """Remove wrapping braces from string"""
-    for brackets in zip('{([{', '}])}'):
-        if s[0] == brackets[0] and s[-1] == brackets[1]:
-            s = s[1:-1]
+    while _is_wrapped_(s):
+        s = s[1:-1]
     return s.strip()
 
 
@@ -67,20 +89,32 @@ def quoted(strings: Iterable[str]) -> Iterable[str]:
     yield from (f"'{s}'" for s in strings)
 
 
+def _day_seconds_(dt: datetime) -> int:
+    return dt.hour * 3600 + dt.minute * 60 + dt.second
+
+
+def _at_day_seconds_(dt: datetime, seconds: int) -> datetime:
+    """Move datetime to given second of its day, carrying overflow to the next day"""
+    days, seconds = divmod(seconds, 86400)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    result = dt.replace(hour=hours, minute=minutes, second=seconds, microsecond=0)
+    return result + timedelta(days) if days else result
+
+
 def round_time(dt: datetime, to: int = 5) -> datetime:
     """Round a datetime object to any interval in min"""
     rounding = to * 60
-    seconds = (dt.replace(tzinfo=None) - dt.min).seconds
-    rounded = (seconds + rounding / 2) // rounding * rounding
-    return dt + timedelta(0, rounded - seconds, -dt.microsecond)
+    seconds = _day_seconds_(dt)
+    return _at_day_seconds_(dt, (seconds + rounding // 2) // rounding * rounding)
 
 
 def round_bounds(start: datetime, end: datetime, to: int = 5) -> Tuple[datetime, datetime]:
     assert start <= end
     rounding = to * 60
 
-    start_seconds = (start.replace(tzinfo=None) - datetime.min).seconds
-    end_seconds = (end.replace(tzinfo=None) - datetime.min).seconds
+    start_seconds = _day_seconds_(start)
+    end_seconds = _day_seconds_(end)
 
     start_rounded = (start_seconds + rounding // 2) // rounding * rounding
     start_shift = start_seconds - start_rounded
@@ -92,10 +126,7 @@ def round_bounds(start: datetime, end: datetime, to: int = 5) -> Tuple[datetime,
     else:
         start_rounded = ((start_seconds - end_shift) + rounding // 2) // rounding * rounding
 
-    return (
-        start + timedelta(0, start_rounded - start_seconds, -start.microsecond),
-        end + timedelta(0, end_rounded - end_seconds, -end.microsecond),
-    )
+    return _at_day_seconds_(start, start_rounded), _at_day_seconds_(end, end_rounded)
 
 
 def seconds_to_duration(total_seconds: int) -> str:
@@ -103,15 +134,16 @@ def seconds_to_duration(total_seconds: int) -> str:
     if total_seconds == 0:
         return "0m"
 
-    minutes, seconds = divmod(abs(total_seconds), 60)
-    hours, minutes = divmod(minutes, 60)
+    hours, minutes = divmod(abs(total_seconds) // 60, 60)
+    sign = '-' if total_seconds < 0 else ''
 
-    components = {"h": hours, "m": minutes}
-    string = ' '.join(str(value) + marker for marker, value in components.items() if value)
-
-    if total_seconds < 0:
-        string = '-' + string
-    return string
+    if hours and minutes:
+        return f"{sign}{hours}h {minutes}m"
+    if hours:
+        return f"{sign}{hours}h"
+    if minutes:
+        return f"{sign}{minutes}m"
+    return sign
 
 
 def timespan_to_duration(timespan: timedelta) -> str:
@@ -140,6 +172,14 @@ def constricted_repr(mapping: dict[str, Any], width: int) -> str:
     return "{" + ", ".join(attrs) + "}"
 
 
+def oneline(text: str) -> str:
+    """Join lines of text with ' | ' separator"""
+    # Every line boundary is a non-printable character, so printable text is a single line
+    if text.isprintable():
+        return text
+    return ' | '.join(text.splitlines())
+
+
 def first_word(string: str) -> str:
     try:
         return string.split(maxsplit=1)[0]
@@ -206,9 +246,35 @@ if __name__ == '__main__':
 
         print("'round_bounds()' tests passed")
 
+    def test_unwrap():
+        unwrap_tests = [
+            ("(title)", "title"),
+            ("[ title ]", "title"),
+            ("{(title)}", "title"),
+            ("((title))", "title"),
+            ("[(title)]", "title"),
+            ("(a) (b)", "(a) (b)"),
+            ("[FM64-1] Fix [v2]", "[FM64-1] Fix [v2]"),
+            ("((a) (b))", "(a) (b)"),
+            ("(a)) ((b)", "(a)) ((b)"),
+            ("(title", "(title"),
+            ("title)", "title)"),
+            ("()", ""),
+            ("", ""),
+        ]
+
+        for string, reference in unwrap_tests:
+            result = unwrap(string)
+            assert result == reference, f"{string = }, {reference = }, {result = }"
+
+        print("'unwrap()' tests passed")
+
     match sys.argv[1:]:
         case ['round-bounds']:
             test_round_bounds()
 
+        case ['unwrap']:
+            test_unwrap()
+
         case _:
             pass